@@ -2,11 +2,13 @@ import os
 from pathlib import Path
 from typing import List, Optional
 from dataclasses import dataclass
-from venv import logger
+import logging
 from core.env_helper import EnvHelper
 from dataclass_wizard import YAMLWizard
 from platformdirs import site_config_dir
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class PortalConfig(YAMLWizard):
     """Configuration for the Schulstick Portal"""
@@ -1,19 +1,20 @@
 from abc import abstractmethod
 from PyQt5.QtWidgets import QWidget
+from core.unit_scanner import UnitScanner
 
 class AbstractUnitCourseView(QWidget):
     """
     Abstract interface for unit and course view widgets.
-    Ensures consistent implementation of reload functionality.
+    Ensures consistent handling of the scanner shared between views.
     """
     
     def __init__(self, parent=None):
         super().__init__(parent)
     
     @abstractmethod
-    def reload(self):
+    def set_scanner(self, scanner: UnitScanner):
         """
-        Reload the content of the view.
+        Replace the scanner and redisplay the content of the view.
         This method must be implemented by all subclasses.
         """
         pass 
\ No newline at end of file
@@ -4,7 +4,7 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                             QScrollArea, QGridLayout, QProgressBar,
                             QStackedWidget,
                             QComboBox)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSignal, QPoint
 from PyQt5.QtGui import QFont
 from core.models import Course, CourseCollection
 from core.unit_scanner import UnitScanner
@@ -37,9 +37,12 @@ class LessonProgressWidget(QWidget):
 
 class UnitBrowserWidget(AbstractUnitCourseView):
     """Widget for browsing courses and their lessons"""
-    def __init__(self, parent=None):
+    reload_requested = pyqtSignal()  # Ask the owner to rescan the shared scanner
+    unit_menu_requested = pyqtSignal(object, QPoint)  # lesson, global position
+    
+    def __init__(self, scanner: UnitScanner, parent=None):
         super().__init__(parent)
-        self.scanner = UnitScanner()
+        self.scanner = scanner
         self.courses_by_title: Dict[str, Course] = {}
         self.all_courses: List[Course] = []
         self.collections: List[CourseCollection] = []
@@ -96,6 +99,7 @@ class UnitBrowserWidget(AbstractUnitCourseView):
         self.detail_view = CourseDetailView(writable=False)
         self.detail_view.back_clicked.connect(self.show_courses_view)
         self.detail_view.course_updated.connect(self.on_course_updated)
+        self.detail_view.unit_menu_requested.connect(self.unit_menu_requested)
         
         # Add both views to stacked widget
         self.stacked_widget.addWidget(self.courses_view)
@@ -104,8 +108,7 @@ class UnitBrowserWidget(AbstractUnitCourseView):
         layout.addWidget(self.stacked_widget)
         
     def load_courses(self):
-        """Load all courses and collections"""
-        self.scanner = UnitScanner()
+        """Load all courses and collections of the current scanner"""
         self.all_courses = self.scanner.list_all_courses()
         self.collections = self.scanner.list_all_collections()
         
@@ -178,8 +181,8 @@ class UnitBrowserWidget(AbstractUnitCourseView):
         if course.title in self.courses_by_title:
             self.courses_by_title[course.title] = course
             
-        # Reload the courses to reflect changes
-        self.load_courses()
+        # Rescan to reflect changes in all views
+        self.reload_requested.emit()
     
     def show_course_detail(self, course_title: str):
         """Show detailed view for a specific course"""
@@ -205,12 +208,13 @@ class UnitBrowserWidget(AbstractUnitCourseView):
         """Show the main courses grid view"""
         self.stacked_widget.setCurrentWidget(self.courses_view)
         
-    def reload(self):
-        """Implement the abstract reload method"""
+    def set_scanner(self, scanner: UnitScanner):
+        """Implement the abstract set_scanner method"""
         # Store the current collection selection
         current_index = self.collection_combo.currentIndex()
         
         # Reload courses and collections
+        self.scanner = scanner
         self.load_courses()
         
         # Restore the previous collection selection if possible
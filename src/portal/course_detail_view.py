@@ -11,7 +11,7 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from portal.course_editor_dialog import CourseEditorDialog
 from portal.publish.course_publisher import CoursePublisher
 from portal.publish.publish_wizard import PublishWizard
-from PyQt5.QtCore import Qt, pyqtSignal, QSize
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QPoint
 from PyQt5.QtGui import QPixmap, QFont, QIcon
 from core.models import BaseLesson, LessonMetadata, Lesson, Course
 from portal.unit_card import UnitCard
@@ -136,6 +136,7 @@ class CourseDetailView(QWidget):
     """Detailed view of a course and its lessons"""
     back_clicked = pyqtSignal()
     course_updated = pyqtSignal(Course)
+    unit_menu_requested = pyqtSignal(object, QPoint)  # lesson, global position
     
     def __init__(self, writable=False, parent=None):
         super().__init__(parent)
@@ -481,4 +482,5 @@ class CourseDetailView(QWidget):
             col = i % 3
             
             card = UnitCard(lesson)
+            card.context_menu_requested.connect(self.unit_menu_requested)
             self.lessons_card_layout.addWidget(card, row, col) 
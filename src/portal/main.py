@@ -11,6 +11,8 @@ def main():
     # Enable high DPI scaling
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    # Required to import QtWebEngine lazily once the tutor is opened
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     
     app = QApplication(sys.argv)
     app.setAttribute(Qt.AA_UseHighDpiPixmaps)
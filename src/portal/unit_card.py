@@ -1,11 +1,10 @@
 from PyQt5.QtWidgets import (QVBoxLayout, QLabel, 
                             QHBoxLayout, QFrame, QSizePolicy, QApplication,
                             QPushButton)
-from PyQt5.QtCore import Qt, pyqtSignal, QSize
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QPoint
 from PyQt5.QtGui import QPixmap, QFont, QPalette, QIcon
 from core.models import BaseLesson, Lesson
 from portal.horizontal_star_rating import HorizontalStarRating
-from portal.unit_context_menu import UnitContextMenu
 from tutor.tutor_proxy import TutorViewProxy
 
 class UnitCard(QFrame):
@@ -15,6 +14,7 @@ class UnitCard(QFrame):
     """
     clicked = pyqtSignal(object)
     play_clicked = pyqtSignal(object)  # New signal for play button clicks
+    context_menu_requested = pyqtSignal(object, QPoint)  # lesson, global position
     
     def __init__(self, lesson: BaseLesson, parent=None):
         super().__init__(parent)
@@ -219,8 +219,7 @@ class UnitCard(QFrame):
     def mousePressEvent(self, event):
         """Handle mouse press events to make the card clickable"""
         if event.button() == Qt.RightButton:
-            context_menu = UnitContextMenu(self.lesson, self)
-            context_menu.exec_(event.globalPos())
+            self.context_menu_requested.emit(self.lesson, event.globalPos())
 
         super().mousePressEvent(event)
         self.clicked.emit(self.lesson)
@@ -229,6 +228,8 @@ class UnitCard(QFrame):
         """Handle mouse enter events for hover effect"""
         super().enterEvent(event)
         self.setCursor(Qt.PointingHandCursor)
+        # Warm the tutor cache if the pointer rests on the card
+        TutorViewProxy.get_instance().prefetch(self.lesson)
         # Make the play button visible by changing its style
         if hasattr(self, 'play_button'):
             self.play_button.setProperty("hover", True)
@@ -250,6 +251,8 @@ class UnitCard(QFrame):
         """Handle mouse leave events for hover effect"""
         super().leaveEvent(event)
         self.setCursor(Qt.ArrowCursor)
+        # The pointer only passed over this card
+        TutorViewProxy.get_instance().cancel_prefetch(self.lesson)
         # Make the play button transparent again
         if hasattr(self, 'play_button'):
             self.play_button.setProperty("hover", False)
@@ -1,15 +1,45 @@
+import os
+import shlex
 import subprocess
-from venv import logger
+from typing import List, Optional
+import logging
 from PyQt5.QtWidgets import QMenu
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QUrl
 from core.models import BaseLesson
 from core.config import PortalConfig
 from portal.tr import tr
 
+logger = logging.getLogger(__name__)
+
+def build_editor_url(config: PortalConfig, relative_markdown_path: str) -> str:
+    """Build the percent-encoded LiaScript editor URL for a markdown file"""
+    url = QUrl(config.liascript_editor_url + config.liascript_editor_proxy_static_url + relative_markdown_path)
+    return bytes(url.toEncoded()).decode()
+
+def build_editor_command(config: PortalConfig, relative_markdown_path: str) -> List[str]:
+    """
+    Build the argument list to open a markdown file in the configured editor.
+    A %f placeholder is replaced by the relative markdown path, otherwise the
+    editor URL is appended to the command (e.g. "chromium --app=").
+    """
+    args = shlex.split(os.path.expandvars(config.liascript_editor_open_command))
+    if any("%f" in arg for arg in args):
+        return [arg.replace("%f", relative_markdown_path) for arg in args]
+    url = build_editor_url(config, relative_markdown_path)
+    if args and args[-1].endswith("="):
+        args[-1] += url
+    else:
+        args.append(url)
+    return args
+
 class UnitContextMenu(QMenu):
-    def __init__(self, unit: BaseLesson, parent=None):
+    """
+    Context menu for unit cards. A single instance is built once and
+    shown for whichever unit was right-clicked.
+    """
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.unit = unit
+        self.unit: Optional[BaseLesson] = None
         self.config = PortalConfig.load()
         self.setup_menu()
         
@@ -20,9 +50,14 @@ class UnitContextMenu(QMenu):
         folder_action = self.addAction(tr("Open Folder"))
         folder_action.triggered.connect(self.open_folder)
         
+    def show_for_unit(self, unit: BaseLesson, global_pos):
+        """Show the menu for the given unit at the specified global position"""
+        self.unit = unit
+        self.exec_(global_pos)
+        
     def open_in_editor(self):
-        command = self.config.liascript_editor_open_command.replace("%f", str(self.unit.relative_markdown_path))
-        subprocess.Popen(command, shell=True)
+        command = build_editor_command(self.config, self.unit.relative_markdown_path)
+        subprocess.Popen(command)
         
     def open_folder(self):
         folder_path = self.unit.markdown_path.parent
@@ -1,18 +1,24 @@
 import os
 import subprocess
 from pathlib import Path
-from venv import logger
+import logging
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QLabel, QLineEdit,
                             QComboBox, QPushButton, QFormLayout, QMessageBox)
 from PyQt5.QtCore import Qt
 from core.unit_scanner import UnitScanner
 from core.config import PortalConfig
 from portal.tr import tr
+from portal.unit_context_menu import build_editor_command
+
+logger = logging.getLogger(__name__)
+
+# Author name used for new lessons, resolved once at import
+_USER = os.environ.get('USER') or 'Anonymous'
 
 class UnitCreateForm(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, scanner: UnitScanner, parent=None):
         super().__init__(parent)
-        self.scanner = UnitScanner()
+        self.scanner = scanner
         self.setWindowTitle(tr("Create New Unit"))
         self.setModal(True)
         self.setup_ui()
@@ -26,8 +32,8 @@ class UnitCreateForm(QDialog):
         self.course_input.setEditable(True)
         self.course_input.setInsertPolicy(QComboBox.InsertPolicy.InsertAlphabetically)
         # Get existing course titles
-        existing_courses = set(course.title for course in self.scanner.courses)
-        self.course_input.addItems(sorted(existing_courses))
+        existing_courses = sorted({course.title for course in self.scanner.courses}, key=str.lower)
+        self.course_input.addItems(existing_courses)
         form_layout.addRow(tr("Course Name:"), self.course_input)
         
         # Lesson name input
@@ -65,15 +71,15 @@ class UnitCreateForm(QDialog):
         if isinstance(base_path, list):
             base_path = base_path[0]  # Use first path if multiple
         
-        course_collection_path = base_path / "drafts"
-        course_path = course_collection_path / course_dir
-        lesson_path = course_path / lesson_dir
+        lesson_path = base_path.joinpath("drafts", course_dir, lesson_dir)
         markdown_file = lesson_path / "README.md"
 
         logger.info(f"Creating lesson at {lesson_path}")
         
-        # Check if lesson already exists
-        if lesson_path.exists():
+        # Create directories, failing if the lesson already exists
+        try:
+            lesson_path.mkdir(parents=True, exist_ok=False)
+        except FileExistsError:
             response = QMessageBox.question(
                 self,
                 tr("Lesson exists"),
@@ -84,13 +90,10 @@ class UnitCreateForm(QDialog):
                 self._open_in_editor(markdown_file)
                 self.accept()
             return
-            
-        # Create directories
-        lesson_path.mkdir(parents=True, exist_ok=True)
         
         # Create template markdown file
         template = f"""<!--
-author:  {os.getenv('USER', 'Anonymous')}
+author:  {_USER}
 email:   
 version:  0.0.1
 language: en
@@ -128,6 +131,5 @@ Welcome to this new lesson!
     def _open_in_editor(self, markdown_file: Path):
         """Open the markdown file in the configured editor"""
         config = PortalConfig.load()
-        url = markdown_file.relative_to(config.get_scan_path())
-        command = config.liascript_editor_open_command.replace("%f", str(url))
-        subprocess.Popen(command, shell=True)
+        relative_path = markdown_file.relative_to(config.get_scan_path()).as_posix()
+        subprocess.Popen(build_editor_command(config, relative_path))
@@ -1,16 +1,18 @@
 from typing import List
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLineEdit,
                             QScrollArea, QWidget, QGridLayout)
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QPoint, pyqtSignal
 from core.models import BaseLesson, LessonMetadata
 from core.unit_scanner import UnitScanner
 from portal.unit_card import UnitCard
 from portal.abstract_unit_course_view import AbstractUnitCourseView
 
 class UnitFinderWidget(AbstractUnitCourseView):
-    def __init__(self, parent=None):
+    unit_menu_requested = pyqtSignal(object, QPoint)  # lesson, global position
+    
+    def __init__(self, scanner: UnitScanner, parent=None):
         super().__init__(parent)
-        self.scanner = UnitScanner()
+        self.scanner = scanner
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self.perform_search)
@@ -63,8 +65,7 @@ class UnitFinderWidget(AbstractUnitCourseView):
         self.display_units(units)
         
     def load_units(self):
-        """Load/reload all units"""
-        self.scanner = UnitScanner()  # Create new scanner instance
+        """Load all units of the current scanner"""
         units = self.scanner.list_all_lessons()
         self.display_units(units)
         
@@ -81,8 +82,10 @@ class UnitFinderWidget(AbstractUnitCourseView):
             row = i // 3  # 3 cards per row
             col = i % 3
             card = UnitCard(unit)
+            card.context_menu_requested.connect(self.unit_menu_requested)
             self.cards_layout.addWidget(card, row, col)
 
-    def reload(self):
-        """Implement the abstract reload method"""
+    def set_scanner(self, scanner: UnitScanner):
+        """Implement the abstract set_scanner method"""
+        self.scanner = scanner
         self.load_units()
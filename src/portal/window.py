@@ -1,12 +1,14 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QToolBar, 
-                            QVBoxLayout, QAction, QSizePolicy, QStackedWidget)
-from PyQt5.QtCore import Qt
+                            QVBoxLayout, QAction, QActionGroup, QSizePolicy,
+                            QStackedWidget)
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QIcon
 from welcome.wizard import WelcomeWizard
+from core.unit_scanner import UnitScanner
 from portal.unit_finder import UnitFinderWidget
 from portal.course_browser import UnitBrowserWidget
 from portal.unit_create_form import UnitCreateForm
-from portal.abstract_unit_course_view import AbstractUnitCourseView
+from portal.unit_context_menu import UnitContextMenu
 
 def tr(text: str) -> str:
     """Helper function for translations"""
@@ -14,11 +16,17 @@ def tr(text: str) -> str:
     return QApplication.translate("Portal", text)
 
 class PortalWindow(QMainWindow):
+    # Emitted with the shared UnitScanner whenever the collection was (re)scanned
+    units_loaded = pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Schulstick Portal")
         self.resize(1024, 768)
         
+        # Single scanner shared by all views
+        self.scanner = UnitScanner()
+        
         # Create central widget and layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -43,7 +51,6 @@ class PortalWindow(QMainWindow):
         # Add view switcher buttons
         self.finder_action = QAction(QIcon.fromTheme("edit-find"), tr("Unit Finder"), self)
         self.finder_action.setCheckable(True)
-        self.finder_action.setChecked(True)
         self.finder_action.triggered.connect(self.show_unit_finder)
         toolbar.addAction(self.finder_action)
         
@@ -52,6 +59,12 @@ class PortalWindow(QMainWindow):
         self.browser_action.triggered.connect(self.show_unit_browser)
         toolbar.addAction(self.browser_action)
         
+        # Let Qt keep the view switcher buttons mutually exclusive
+        view_group = QActionGroup(self)
+        view_group.setExclusive(True)
+        view_group.addAction(self.finder_action)
+        view_group.addAction(self.browser_action)
+        
         # Add expanding spacer to push settings to the right
         spacer = QWidget()
         spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
@@ -71,45 +84,50 @@ class PortalWindow(QMainWindow):
         settings_action = QAction(QIcon.fromTheme("preferences-system"), tr("Settings"), self)
         toolbar.addAction(settings_action)
         
+        # Context menu shared by all unit cards
+        self.unit_menu = UnitContextMenu(self)
+        
         # Create stacked widget to hold different views
         self.stacked_widget = QStackedWidget()
         layout.addWidget(self.stacked_widget)
         
         # Add unit finder widget
-        self.unit_finder = UnitFinderWidget()
+        self.unit_finder = UnitFinderWidget(self.scanner)
+        self.units_loaded.connect(self.unit_finder.set_scanner)
+        self.unit_finder.unit_menu_requested.connect(self.unit_menu.show_for_unit)
         self.stacked_widget.addWidget(self.unit_finder)
         
         # Add unit browser widget
-        self.unit_browser = UnitBrowserWidget()
+        self.unit_browser = UnitBrowserWidget(self.scanner)
+        self.unit_browser.reload_requested.connect(self.reload_units)
+        self.units_loaded.connect(self.unit_browser.set_scanner)
+        self.unit_browser.unit_menu_requested.connect(self.unit_menu.show_for_unit)
         self.stacked_widget.addWidget(self.unit_browser)
         
-        # Set unit finder as default view
-        self.stacked_widget.setCurrentWidget(self.unit_browser)
+        # Set unit browser as default view
+        self.show_unit_browser()
         
     def show_wizard(self):
         wizard = WelcomeWizard()
         wizard.exec_()
         
     def show_create_form(self):
-        form = UnitCreateForm(self)
+        form = UnitCreateForm(self.scanner, self)
         if form.exec_() == UnitCreateForm.Accepted:
-            # We'll implement the actual creation in the next step
-            pass
+            # Rescan so the new lesson shows up in the views and the next form
+            self.reload_units()
             
     def reload_units(self):
-        """Reload all units by rescanning the collection"""
-        current_widget = self.stacked_widget.currentWidget()
-        if isinstance(current_widget, AbstractUnitCourseView):
-            current_widget.reload()
+        """Reload all units by rescanning the collection once for all views"""
+        self.scanner = UnitScanner()
+        self.units_loaded.emit(self.scanner)
     
     def show_unit_finder(self):
         """Switch to unit finder view"""
         self.stacked_widget.setCurrentWidget(self.unit_finder)
         self.finder_action.setChecked(True)
-        self.browser_action.setChecked(False)
     
     def show_unit_browser(self):
         """Switch to unit browser view"""
         self.stacked_widget.setCurrentWidget(self.unit_browser)
-        self.finder_action.setChecked(False)
         self.browser_action.setChecked(True)
@@ -1,19 +1,18 @@
 from enum import Enum
 import logging
 from PyQt5.QtWidgets import (QWidget, QPushButton, QApplication, QVBoxLayout, 
-                            QHBoxLayout, QSizePolicy, QMenu, QAction,
+                            QBoxLayout, QSizePolicy, QMenu, QAction,
                             QMessageBox, QCheckBox)
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect, QUrl, QSize, QObject, pyqtSlot
-from PyQt5.QtGui import QPainter, QColor, QIcon
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtWebChannel import QWebChannel
-import json
+from PyQt5.QtCore import (Qt, QPropertyAnimation, QEasingCurve, QRect, QUrl, QSize, QObject,
+                          QFile, QIODevice, pyqtSlot)
+from PyQt5.QtGui import QIcon
 import subprocess
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, TYPE_CHECKING
 from core.models import BaseLesson, LessonMetadata, ViewMode, DockPosition, ScreenHint
-from core.preferences import Preferences
-from core.launcher import ProgramLauncher
+
+if TYPE_CHECKING:
+    from PyQt5.QtWebEngineWidgets import QWebEngineProfile
 
 # Translation context for all tutor pages
 TRANSLATION_CONTEXT = "TutorView"
@@ -25,16 +24,34 @@ def tr(text: str, *args) -> str:
         return translated % args
     return translated
 
-class CollapseIcons:
-    BOTTOM = ("▼", "▲")
-    TOP = ("▲", "▼")
-    LEFT = ("◀", "▶")
-    RIGHT = ("▶", "◀")
+# Toggle button labels per dock position as (expanded, collapsed)
+_COLLAPSE_ICONS = {
+    DockPosition.BOTTOM: ("▼", "▲"),
+    DockPosition.TOP: ("▲", "▼"),
+    DockPosition.LEFT: ("◀", "▶"),
+    DockPosition.RIGHT: ("▶", "◀"),
+}
 
 class TutorView(QWidget):
+    # Theme icons of the dock menu entries, resolved once on first use
+    DOCK_MENU_ICON_NAMES = {
+        (ViewMode.FREE, None): "window",
+        (ViewMode.DOCKED, DockPosition.LEFT): "format-justify-left",
+        (ViewMode.DOCKED, DockPosition.RIGHT): "format-justify-right",
+        (ViewMode.DOCKED, DockPosition.TOP): "format-text-direction-vertical",
+        (ViewMode.DOCKED, DockPosition.BOTTOM): "format-text-direction-vertical",
+        "close": "window-close",
+    }
+    _dock_menu_icons = None
+    _qwebchannel_source = None
     
-    def __init__(self, unit: BaseLesson, disable_program: bool = False):
+    def __init__(self, unit: BaseLesson, disable_program: bool = False,
+                 profile: Optional['QWebEngineProfile'] = None):
         super().__init__()
+        # QtWebEngine is expensive to initialize, only load it once a tutor is opened
+        from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage, QWebEngineScript
+        from PyQt5.QtWebChannel import QWebChannel
+        
         self.unit = unit
         if isinstance(unit, LessonMetadata) and  unit.screen_hint != None:
             self.screen_hint = unit.screen_hint
@@ -52,20 +69,10 @@ class TutorView(QWidget):
         self.customContextMenuRequested.connect(self.show_context_menu)
         
         # Set window properties based on mode
-        if self.mode == ViewMode.DOCKED:
-            self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-            self.setAttribute(Qt.WA_TranslucentBackground)
-        else:
-            self.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
+        self.apply_window_flags()
         
         # Get current screen based on mouse position
-        cursor_pos = QApplication.desktop().cursor().pos()
-        self.current_screen = QApplication.desktop().screenNumber(cursor_pos)
-        
-        # Create main layout based on position
-        self.main_layout = QHBoxLayout() if self.position in [DockPosition.LEFT, DockPosition.RIGHT] else QVBoxLayout()
-        self.main_layout.setContentsMargins(0, 0, 0, 0)
-        self.setLayout(self.main_layout)
+        self._screen_rect = self._fetch_screen_rect()
         
         # Create content widget
         self.content_widget = QWidget()
@@ -75,67 +82,54 @@ class TutorView(QWidget):
             
         # Create web view with transparent background
         self.web_view = QWebEngineView()
+        if profile is not None:
+            # Use the shared profile so caches survive between tutor views
+            self.web_view.setPage(QWebEnginePage(profile, self.web_view))
+        
+        # Track navigation natively, including hash changes
+        self.web_view.page().urlChanged.connect(self.on_url_changed)
         
-        # Inject JavaScript to monitor navigation
+        # Inject JavaScript to intercept external links
         js_code = """
-        // Load QWebChannel JavaScript library
-        var script = document.createElement('script');
-        script.src = 'qrc:///qtwebchannel/qwebchannel.js';
-        script.onload = function() {
-            // Initialize after library loads
-            new QWebChannel(qt.webChannelTransport, function(channel) {
-                window.handler = channel.objects.handler;
-                
-                // Set up hash change monitoring
-                let lastHash = window.location.hash;
-                function pollHash() {
-                    if (window.location.hash !== lastHash) {
-                        lastHash = window.location.hash;
-                        try {
-                            handler.handleMessage(JSON.stringify({
-                                'type': 'urlChanged',
-                                'url': window.location.href
-                            }));
-                        } catch (e) {
-                            console.warn('Error sending message:', e);
-                        }
-                    }
+        // QWebChannel is injected as a separate user script at document creation
+        new QWebChannel(qt.webChannelTransport, function(channel) {
+            window.handler = channel.objects.handler;
+            
+            // Coalesce link clicks within one frame into a single host call
+            let pendingLinks = [];
+            function queueExternalLink(url) {
+                if (pendingLinks.length === 0) {
+                    requestAnimationFrame(function() {
+                        handler.onExternalLinks(pendingLinks);
+                        pendingLinks = [];
+                    });
                 }
-                
-                // Start polling
-                setInterval(pollHash, 500);
-                
-                // Send initial URL
-                handler.handleMessage(JSON.stringify({
-                    'type': 'urlChanged',
-                    'url': window.location.href
-                }));
-
-                // Add click handler for external links
-                document.addEventListener('click', function(e) {
-                    let target = e.target;
-                    // Find closest anchor tag if clicked element is not an anchor
-                    while (target && target.tagName !== 'A') {
-                        target = target.parentElement;
-                    }
-                    if (target && target.href && !target.href.startsWith(window.location.origin)) {
-                        e.preventDefault();
-                        handler.handleMessage(JSON.stringify({
-                            'type': 'externalLink',
-                            'url': target.href
-                        }));
-                    }
-                }, true);
-            });
-        };
-        document.head.appendChild(script);
+                if (pendingLinks.indexOf(url) === -1) {
+                    pendingLinks.push(url);
+                }
+            }
+            
+            // Add click handler for external links
+            document.addEventListener('click', function(e) {
+                // Find closest anchor tag if clicked element is not an anchor
+                const anchor = e.target.closest && e.target.closest('a');
+                if (!anchor) {
+                    return;
+                }
+                if (anchor.href && !anchor.href.startsWith(window.location.origin)) {
+                    e.preventDefault();
+                    queueExternalLink(anchor.href);
+                }
+            }, {capture: true, passive: false});
+        });
         """
         
-        # Create handler object for JavaScript messages
+        # Create handler object exposing typed slots to JavaScript
         class Handler(QObject):
-            @pyqtSlot(str)
-            def handleMessage(self, message):
-                self.parent().handle_js_message(message)
+            @pyqtSlot('QVariantList')
+            def onExternalLinks(self, urls):
+                for url in urls:
+                    self.parent().handle_external_link(url)
                 
         self.handler = Handler()
         self.handler.parent = lambda: self
@@ -145,10 +139,23 @@ class TutorView(QWidget):
         self.channel.registerObject('handler', self.handler)
         self.web_view.page().setWebChannel(self.channel)
         
-        # Add JavaScript injection after page loads
-        self.web_view.loadFinished.connect(
-            lambda ok: self.web_view.page().runJavaScript(js_code) if ok else None
-        )
+        # Install the QWebChannel library from Qt's resources, so pages don't have to fetch it
+        library = QWebEngineScript()
+        library.setName("qwebchannel")
+        library.setSourceCode(self.get_qwebchannel_source())
+        library.setInjectionPoint(QWebEngineScript.DocumentCreation)
+        library.setWorldId(QWebEngineScript.MainWorld)
+        library.setRunsOnSubFrames(False)
+        self.web_view.page().scripts().insert(library)
+        
+        # Install the JavaScript once, the engine injects it on every load
+        script = QWebEngineScript()
+        script.setName("tutor-bridge")
+        script.setSourceCode(js_code)
+        script.setInjectionPoint(QWebEngineScript.DocumentReady)
+        script.setWorldId(QWebEngineScript.MainWorld)
+        script.setRunsOnSubFrames(False)
+        self.web_view.page().scripts().insert(script)
         
         self.web_view.page().setBackgroundColor(Qt.transparent)
         self.web_view.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -166,11 +173,61 @@ class TutorView(QWidget):
             self.current_url = initial_url
             self.logger.info(f"Loading initial URL: {initial_url.toString()}")
         
-        # Create and setup toggle button if in docked mode
+        # Create toggle button, only shown in docked mode
+        self.toggle_btn = QPushButton(self)
+        self.toggle_btn.clicked.connect(self.toggle_expansion)
+        
+        # Create main layout based on mode and position
+        self.setup_layout()
+        
+        # Setup expand/collapse animation once, toggle_expansion only updates its values
+        self.animation = QPropertyAnimation(self, b"geometry")
+        self.animation.setDuration(300)
+        self.animation.setEasingCurve(QEasingCurve.InOutQuad)
+        self.animation.finished.connect(self.on_animation_finished)
+        
+        # Initialize screen geometry and apply hints
+        self.update_screen_geometry()
+        self.apply_screen_hints()
+        
+        # Launch associated program if specified
+        if isinstance(self.unit, LessonMetadata) and self.unit.program_launch_info and not disable_program:
+            from core.launcher import ProgramLauncher
+            self.program_process = ProgramLauncher.launch_program(self.unit)
+
+    def apply_window_flags(self):
+        """Set window flags and attributes for the current mode"""
+        if self.mode == ViewMode.DOCKED:
+            self.setAttribute(Qt.WA_TranslucentBackground, True)
+            self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+            # Semi-transparent background, painted and cached by the style
+            self.setAttribute(Qt.WA_StyledBackground, True)
+            self.setStyleSheet("TutorView { background-color: rgba(40, 40, 40, 200); }")
+        else:
+            self.setAttribute(Qt.WA_TranslucentBackground, False)
+            self.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
+            self.setAttribute(Qt.WA_StyledBackground, False)
+            self.setStyleSheet("")
+
+    def setup_layout(self):
+        """(Re)build the main layout for the current mode and position"""
+        if self.layout() is None:
+            self.main_layout = QBoxLayout(QBoxLayout.TopToBottom)
+            self.main_layout.setContentsMargins(0, 0, 0, 0)
+            self.setLayout(self.main_layout)
+        else:
+            # Detach the widgets without deleting them, they are re-added below
+            while self.main_layout.count():
+                self.main_layout.takeAt(0)
+        
+        if self.position in [DockPosition.LEFT, DockPosition.RIGHT]:
+            self.main_layout.setDirection(QBoxLayout.LeftToRight)
+        else:
+            self.main_layout.setDirection(QBoxLayout.TopToBottom)
+        
         if self.mode == ViewMode.DOCKED:
-            self.toggle_btn = QPushButton()
-            self.toggle_btn.clicked.connect(self.toggle_expansion)
             self.setup_toggle_button()
+            self.toggle_btn.show()
             
             # Add widgets to main layout in correct order
             if self.position in [DockPosition.RIGHT, DockPosition.BOTTOM]:
@@ -180,16 +237,24 @@ class TutorView(QWidget):
                 self.main_layout.addWidget(self.content_widget)
                 self.main_layout.addWidget(self.toggle_btn)
         else:
-            self.toggle_btn = None
+            self.toggle_btn.hide()
             self.main_layout.addWidget(self.content_widget)
+
+    def reconfigure(self, mode: ViewMode, position: DockPosition):
+        """Switch mode and position in place, keeping the loaded page alive"""
+        self.animation.stop()
+        self.mode = mode
+        self.position = position
+        self.is_expanded = True
+        self.set_content_visible(True)
         
-        # Initialize screen geometry and apply hints
-        self.update_screen_geometry()
+        self.apply_window_flags()
+        self.setup_layout()
+        # Dock to the screen the user is working on now
+        self.update_screen_geometry(refresh=True)
         self.apply_screen_hints()
-        
-        # Launch associated program if specified
-        if isinstance(self.unit, LessonMetadata) and self.unit.program_launch_info and not disable_program:
-            self.program_process = ProgramLauncher.launch_program(self.unit)
+        # Changing the window flags hides the window
+        self.show()
 
     def setup_toggle_button(self):
         """Setup the toggle button appearance and position"""
@@ -213,24 +278,27 @@ class TutorView(QWidget):
         
     def update_toggle_button_icon(self):
         """Update toggle button icon based on position and state"""
-        if not self.toggle_btn:
+        if self.mode != ViewMode.DOCKED:
             return
             
-        icons = getattr(CollapseIcons, self.position.value.upper())
+        icons = _COLLAPSE_ICONS[self.position]
         self.toggle_btn.setText(icons[0] if self.is_expanded else icons[1])
         
-    def update_screen_geometry(self):
-        """Update geometry based on current screen"""
-        screen = QApplication.desktop().screenGeometry(self.current_screen)
+    def _fetch_screen_rect(self) -> QRect:
+        """Query the geometry of the screen under the mouse cursor"""
+        desktop = QApplication.desktop()
+        self.current_screen = desktop.screenNumber(desktop.cursor().pos())
+        return desktop.screenGeometry(self.current_screen)
+
+    def update_screen_geometry(self, refresh: bool = False):
+        """Update geometry based on current screen, refetching it if requested"""
+        if refresh:
+            self._screen_rect = self._fetch_screen_rect()
+        screen = self._screen_rect
         self.screen_width = screen.width()
         self.screen_height = screen.height()
         self.screen_x = screen.x()
         self.screen_y = screen.y()
-        
-        # Setup animation
-        self.animation = QPropertyAnimation(self, b"geometry")
-        self.animation.setDuration(300)
-        self.animation.setEasingCurve(QEasingCurve.InOutQuad)
 
     def get_dimensions(self) -> Tuple[int, int]:
         """Calculate dimensions based on mode and hints"""
@@ -302,20 +370,37 @@ class TutorView(QWidget):
             else:
                 new_rect = QRect(current_geo.x(), self.screen_y, current_geo.width(), new_height)
         
+        # Show content before expanding, hide it only once collapsed
+        if self.is_expanded:
+            self.set_content_visible(True)
+        
+        self.animation.stop()
         self.animation.setStartValue(current_geo)
         self.animation.setEndValue(new_rect)
         self.animation.start()
         
         self.update_toggle_button_icon()
         
-    def paintEvent(self, event):
-        if self.mode == ViewMode.DOCKED:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
-            
-            # Draw semi-transparent background
-            painter.fillRect(self.rect(), QColor(40, 40, 40, 200))
-
+    def on_animation_finished(self):
+        """Hide the web content once the view is collapsed"""
+        if not self.is_expanded:
+            self.set_content_visible(False)
+        
+    def set_content_visible(self, visible: bool):
+        """Show or hide the web content, freezing the renderer while hidden"""
+        page = self.web_view.page()
+        # Lifecycle states are only available from Qt 5.14 on
+        has_lifecycle = hasattr(page, 'setLifecycleState')
+        if visible:
+            if has_lifecycle:
+                page.setLifecycleState(page.LifecycleState.Active)
+            self.content_widget.setVisible(True)
+        else:
+            # Only invisible pages may be frozen
+            self.content_widget.setVisible(False)
+            if has_lifecycle:
+                page.setLifecycleState(page.LifecycleState.Frozen)
+        
     def closeEvent(self, event):
         """Handle window close event"""
         # Clean up web view resources
@@ -346,18 +431,19 @@ class TutorView(QWidget):
     def show_dock_menu(self, global_pos):
         """Show the dock mode selection menu at the specified global position"""
         menu = QMenu(self)
+        icons = self.get_dock_menu_icons()
         
-        # Create actions for each dock mode
+        # Create actions for each dock mode, texts are translated per call
         actions = {
-            (ViewMode.FREE, None): (QIcon.fromTheme("window"), tr("Undocked")),
-            (ViewMode.DOCKED, DockPosition.LEFT): (QIcon.fromTheme("format-justify-left"), tr("Dock Left")),
-            (ViewMode.DOCKED, DockPosition.RIGHT): (QIcon.fromTheme("format-justify-right"), tr("Dock Right")),
-            (ViewMode.DOCKED, DockPosition.TOP): (QIcon.fromTheme("format-text-direction-vertical"), tr("Dock Top")),
-            (ViewMode.DOCKED, DockPosition.BOTTOM): (QIcon.fromTheme("format-text-direction-vertical"), tr("Dock Bottom"))
+            (ViewMode.FREE, None): tr("Undocked"),
+            (ViewMode.DOCKED, DockPosition.LEFT): tr("Dock Left"),
+            (ViewMode.DOCKED, DockPosition.RIGHT): tr("Dock Right"),
+            (ViewMode.DOCKED, DockPosition.TOP): tr("Dock Top"),
+            (ViewMode.DOCKED, DockPosition.BOTTOM): tr("Dock Bottom")
         }
         
-        for (mode, position), (icon, text) in actions.items():
-            action = QAction(icon, text, self)
+        for (mode, position), text in actions.items():
+            action = QAction(icons[(mode, position)], text, menu)
             action.setCheckable(True)
             action.setChecked(self.mode == mode and (mode == ViewMode.FREE or self.position == position))
             action.triggered.connect(lambda checked, m=mode, p=position: self.change_dock_mode(m, p))
@@ -365,48 +451,51 @@ class TutorView(QWidget):
 
         menu.addSeparator()
         
-        close_action = QAction(QIcon.fromTheme("window-close"), tr("Close"), self)
+        close_action = QAction(icons["close"], tr("Close"), menu)
         close_action.triggered.connect(self.close)
         menu.addAction(close_action)
         
         menu.exec_(global_pos)
+        menu.deleteLater()
+    
+    @classmethod
+    def get_qwebchannel_source(cls) -> str:
+        """Read the QWebChannel JavaScript library from Qt's resources once"""
+        if cls._qwebchannel_source is None:
+            library = QFile(":/qtwebchannel/qwebchannel.js")
+            if not library.open(QIODevice.ReadOnly):
+                logging.getLogger(__name__).error("Failed to read qwebchannel.js from Qt resources")
+                return ""
+            cls._qwebchannel_source = bytes(library.readAll()).decode("utf-8")
+            library.close()
+        return cls._qwebchannel_source
+    
+    @classmethod
+    def get_dock_menu_icons(cls) -> dict:
+        """Resolve the dock menu theme icons once and share them between views"""
+        if cls._dock_menu_icons is None:
+            cls._dock_menu_icons = {key: QIcon.fromTheme(name) for key, name in cls.DOCK_MENU_ICON_NAMES.items()}
+        return cls._dock_menu_icons
     
     def change_dock_mode(self, new_mode: ViewMode, new_position: Optional[DockPosition] = None):
-        """Change the dock mode and position of the window by creating a new instance with overridden ScreenHint"""
+        """Change the dock mode and position of the window in place"""
         if new_mode == self.mode and (new_mode == ViewMode.FREE or new_position == self.position):
             return
             
-        # Create a new unit with overridden screen hint
-        modified_unit = self.unit
-        modified_unit.screen_hint = ScreenHint(
+        self.screen_hint = ScreenHint(
             position=new_position or self.position,
             mode=new_mode,
             preferred_width=self.screen_hint.preferred_width,
             preferred_height=self.screen_hint.preferred_height
         )
-        
-        current_url = self.current_url
-        
-        # Create new window with the modified unit using singleton pattern
-        from .tutor_proxy import TutorViewProxy
-        new_window = TutorViewProxy.get_instance().open_tutor(modified_unit, force_new=True, disable_program=True)
-        
-        if current_url:
-            new_window.web_view.setUrl(current_url)
-            
-        new_window.show()
-        
-        if hasattr(self, 'web_view'):
-            self.web_view.page().deleteLater()
-            self.web_view.deleteLater()
-            
-        # Close this window
-        self.close()
+        self.reconfigure(self.screen_hint.mode, self.screen_hint.position)
 
 
     def handle_external_link(self, url: str) -> None:
         """Handle clicks on external links"""
-        preferences = Preferences.load()
+        from .tutor_proxy import TutorViewProxy
+        proxy = TutorViewProxy.get_instance()
+        preferences = proxy.get_preferences()
         
         if preferences.support.allow_external_links  and preferences.support.remember_external_links:
             # Open directly if allowed and remembered
@@ -433,14 +522,22 @@ class TutorView(QWidget):
                 preferences.support.allow_external_links = True
                 if remember.isChecked():
                     preferences.support.remember_external_links = True
-                preferences.save()
+                proxy.save_preferences(preferences)
                 self.open_external_link(url)
     
     def open_external_link(self, url: str) -> None:
         """Open URL in default browser using xdg-open"""
         try:
-            subprocess.run(['xdg-open', url])
-        except subprocess.CalledProcessError as e:
+            # Detach from xdg-open so the UI never waits for the browser to start
+            subprocess.Popen(
+                ['xdg-open', url],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+                close_fds=True
+            )
+        except OSError as e:
             self.logger.error(f"Failed to open URL: {e}")
             QMessageBox.critical(
                 self,
@@ -448,14 +545,7 @@ class TutorView(QWidget):
                 self.tr("Failed to open external link: {url}").format(url=url)
             )
 
-    def handle_js_message(self, message):
-        """Handle messages from injected JavaScript"""
-        try:
-            data = json.loads(message)
-            if data['type'] == 'urlChanged':
-                self.current_url = QUrl(data['url'])
-            elif data['type'] == 'externalLink':
-                self.handle_external_link(data['url'])
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Failed to parse JSON message: {e}")
-            self.logger.error(f"Raw message was: {message}")
+    def on_url_changed(self, url: QUrl) -> None:
+        """Keep track of the URL currently shown in the web view"""
+        self.current_url = url
+
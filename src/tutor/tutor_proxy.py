@@ -1,50 +1,155 @@
-from typing import Optional
-from venv import logger
-from PyQt5.QtCore import QObject
-from .tutor import TutorView
+from typing import Optional, TYPE_CHECKING
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QTimer, QUrl
+from PyQt5.QtWidgets import QApplication
 from core.models import BaseLesson
+from core.preferences import Preferences
+
+if TYPE_CHECKING:
+    from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineProfile
+    from .tutor import TutorView
 
 class TutorViewProxy(QObject):
     """
     A proxy that manages a single TutorView instance.
     """
-    _instance = None
+    
+    # How long the pointer has to rest on a unit before its tutorial is prefetched
+    PREFETCH_DELAY_MS = 400
     
     def __init__(self):
         super().__init__()
-        self._active_view: Optional[TutorView] = None
+        self._active_view: Optional['TutorView'] = None
+        self._profile: Optional['QWebEngineProfile'] = None
+        self._prefetch_page: Optional['QWebEnginePage'] = None
+        self._prefetch_timer: Optional[QTimer] = None
+        self._pending_prefetch: Optional[BaseLesson] = None
+        self._prefetched_key = None
+        self._preferences: Optional[Preferences] = None
+        self._preferences_mtime: Optional[int] = None
     
     @classmethod
     def get_instance(cls) -> 'TutorViewProxy':
         """Get the singleton proxy instance"""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        return _INSTANCE
+    
+    @property
+    def profile(self) -> 'QWebEngineProfile':
+        """Web engine profile shared by all tutor views, created on first use"""
+        if self._profile is None:
+            from PyQt5.QtWebEngineWidgets import QWebEngineProfile
+            self._profile = QWebEngineProfile("tutor", self)
+            self._profile.setHttpCacheType(QWebEngineProfile.MemoryHttpCache)
+            self._profile.setPersistentCookiesPolicy(QWebEngineProfile.AllowPersistentCookies)
+            # Pages must be gone before their profile, which the object tree does not guarantee
+            QApplication.instance().aboutToQuit.connect(self._release_web_engine)
+        return self._profile
+    
+    def _release_web_engine(self) -> None:
+        """Delete all web engine pages, then the profile they use"""
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+        if self._active_view is not None:
+            sip.delete(self._active_view)
+            self._active_view = None
+        if self._prefetch_page is not None:
+            sip.delete(self._prefetch_page)
+            self._prefetch_page = None
+        if self._profile is not None:
+            sip.delete(self._profile)
+            self._profile = None
     
-    def open_tutor(self, unit: BaseLesson, force_new: bool = False, disable_program: bool = False) -> TutorView:
+    def get_preferences(self) -> Preferences:
+        """Return the cached preferences, reloading them only if the file changed on disk"""
+        mtime = self._get_preferences_mtime()
+        if self._preferences is None or mtime != self._preferences_mtime:
+            self._preferences = Preferences.load()
+            self._preferences_mtime = mtime
+        return self._preferences
+    
+    def save_preferences(self, preferences: Preferences) -> None:
+        """Save the preferences and update the cache without reading them back"""
+        preferences.save()
+        self._preferences = preferences
+        self._preferences_mtime = self._get_preferences_mtime()
+    
+    @staticmethod
+    def _get_preferences_mtime() -> Optional[int]:
+        """Modification time of the preferences file, None if it does not exist"""
+        try:
+            return Preferences._get_config_path().stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+    
+    def prefetch(self, unit: BaseLesson) -> None:
+        """
+        Schedule loading the unit's tutorial in a hidden page on the shared profile,
+        so its resources are already cached when the tutor is opened.
+        The page is only loaded if the unit is not cancelled within PREFETCH_DELAY_MS.
+        """
+        if self._unit_key(unit) == self._prefetched_key:
+            return
+        if self._prefetch_timer is None:
+            self._prefetch_timer = QTimer(self)
+            self._prefetch_timer.setSingleShot(True)
+            self._prefetch_timer.timeout.connect(self._load_prefetch)
+        self._pending_prefetch = unit
+        self._prefetch_timer.start(self.PREFETCH_DELAY_MS)
+    
+    def cancel_prefetch(self, unit: BaseLesson) -> None:
+        """Drop a scheduled prefetch of the unit that has not started yet"""
+        if self._pending_prefetch is unit:
+            self._prefetch_timer.stop()
+            self._pending_prefetch = None
+    
+    def _load_prefetch(self) -> None:
+        """Load the tutorial of the pending unit into the hidden prefetch page"""
+        unit = self._pending_prefetch
+        self._pending_prefetch = None
+        if unit is None:
+            return
+        url = unit.tutorial_url
+        if not url:
+            return
+        if self._prefetch_page is None:
+            from PyQt5.QtWebEngineWidgets import QWebEnginePage
+            self._prefetch_page = QWebEnginePage(self.profile, self)
+            # Lifecycle states are only available from Qt 5.14 on
+            if hasattr(self._prefetch_page, 'recommendedStateChanged'):
+                # The page is never shown, let Qt freeze and discard it once loaded
+                self._prefetch_page.recommendedStateChanged.connect(self._prefetch_page.setLifecycleState)
+        if hasattr(self._prefetch_page, 'setLifecycleState'):
+            self._prefetch_page.setLifecycleState(self._prefetch_page.LifecycleState.Active)
+        self._prefetched_key = self._unit_key(unit)
+        self._prefetch_page.load(QUrl(url))
+    
+    @staticmethod
+    def _unit_key(unit: BaseLesson):
+        """Key identifying the lesson a view was opened for"""
+        return unit.content_path or id(unit)
+    
+    def open_tutor(self, unit: BaseLesson, force_new: bool = False, disable_program: bool = False) -> 'TutorView':
         """
         Open a tutor view for the given unit.
         If a view already exists, it will be brought to front.
         """
-
-        if self._active_view and self._active_view.unit == unit and not force_new:
+        key = self._unit_key(unit)
+        if self._active_view and self._unit_key(self._active_view.unit) == key and not force_new:
             self._active_view.show()
             return self._active_view
 
-
         if self._active_view:
             self.close_tutor()
-
-
         
-        # Create new view
-        self._active_view = TutorView(unit, disable_program=disable_program)
+        # Create new view, deferring the QtWebEngine import until a tutor is opened
+        from .tutor import TutorView
+        self._active_view = TutorView(unit, disable_program=disable_program, profile=self.profile)
         self._active_view.show()
         return self._active_view
 
     def remove_tutor(self, unit: BaseLesson) -> None:
         """Remove the tutor view for the given unit"""
-        if self._active_view and self._active_view.unit == unit:
+        if self._active_view and self._unit_key(self._active_view.unit) == self._unit_key(unit):
             self._active_view = None
 
     def close_tutor(self) -> None:
@@ -52,3 +157,6 @@ class TutorViewProxy(QObject):
         if self._active_view:
             self._active_view.close()
             self._active_view = None
+
+# Singleton created eagerly at import, heavy resources are created on first use
+_INSTANCE = TutorViewProxy()
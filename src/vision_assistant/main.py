@@ -7,19 +7,73 @@ from urllib.parse import urljoin
 import base64
 from PyQt5.QtWidgets import (QApplication, QWidget, QPushButton, QLineEdit,
                             QMenu, QAction, QSystemTrayIcon)
-from PyQt5.QtCore import QBuffer, QByteArray
+from PyQt5.QtCore import QBuffer, QByteArray, QThread, pyqtSignal
 from core.assets import Assets
 from core.preferences import Preferences
 from portal.window import PortalWindow
 from vision_assistant.vision import HighlightOverlay
 from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect
-from PyQt5.QtGui import (QPainter, QPainterPath, QColor, QIcon, QMovie, QPixmap)
+from PyQt5.QtGui import (QPainter, QPainterPath, QIcon, QMovie, QPixmap, QImage, QRegion)
 
 os.environ['QT_LOGGING_RULES'] = '*.debug=false;qt.qpa.*=false;qt.*=false;*.warning=false'
 #maximize logging
 #os.environ['QT_LOGGING_RULES'] = '*.debug=true;qt.qpa.*=true;qt.*=true;*.warning=true'
 
+class SessionWorker(QThread):
+    """Worker thread creating the vision API session without blocking startup"""
+    
+    session_created = pyqtSignal(object)  # Session id or None on failure
+    
+    # Seconds to wait for the API before giving up on the session
+    TIMEOUT = 10
+    
+    def __init__(self, session, base_url, parent=None):
+        super().__init__(parent)
+        self.session = session
+        self.base_url = base_url
+        self.logger = logging.getLogger(__name__)
+        
+    def run(self):
+        """Request a new session from the API in a background thread"""
+        try:
+            response = self.session.post(urljoin(self.base_url, 'session'), timeout=self.TIMEOUT)
+            response.raise_for_status()
+            self.session_created.emit(response.json()['session_id'])
+        except Exception as e:
+            self.logger.error(f"Failed to create API session: {e}")
+            self.session_created.emit(None)
+
 class CircularWindow(QWidget):
+    # Longest side of screenshots sent to the vision API
+    MAX_SCREENSHOT_SIZE = 2048
+    
+    # Search controls are transparent over the cloud, and filled over the static
+    # expanded background so they don't have to be composed with it on every repaint
+    SEARCH_INPUT_STYLE = """
+        QLineEdit {
+            background-color: %s;
+            border: 2px solid white;
+            border-radius: 15px;
+            padding: 5px 15px;
+            color: white;
+            selection-background-color: rgba(255, 255, 255, 50);
+        }
+    """
+    SEARCH_BUTTON_STYLE = """
+        QPushButton {
+            background-color: %s;
+            border: 2px solid white;
+            border-radius: 15px;
+            padding: 5px;
+            color: white;
+        }
+        QPushButton:hover {
+            background-color: rgba(255, 255, 255, 50);
+        }
+    """
+    COLLAPSED_CONTROL_BACKGROUND = "transparent"
+    EXPANDED_CONTROL_BACKGROUND = "rgba(0, 0, 0, 160)"
+    
     def __init__(self):
         super().__init__()
         self.porttal = None 
@@ -36,14 +90,16 @@ class CircularWindow(QWidget):
             'X-API-KEY': self.api_key
         })
         
-        # Create initial session
-        try:
-            response = self.session.post(urljoin(self.base_url, 'session'))
-            response.raise_for_status()
-            self.session_id = response.json()['session_id']
-        except Exception as e:
-            self.logger.error(f"Failed to create API session: {e}")
-            self.session_id = None
+        # Create initial session in the background, the window shows up right away
+        self.session_id = None
+        self.session_worker = SessionWorker(self.session, self.base_url, self)
+        self.session_worker.session_created.connect(self.on_session_created)
+        # A running thread must not be destroyed on quit, let the request finish or time out
+        QApplication.instance().aboutToQuit.connect(self.stop_session_worker)
+        self.session_worker.start()
+        
+        # Overlay showing the hints, cheap to create and reused for every answer
+        self.highlight_overlay = HighlightOverlay()
         # Remove window decorations and make window stay on top
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         # Enable transparency
@@ -51,6 +107,7 @@ class CircularWindow(QWidget):
         
         # Window state
         self.is_expanded = False
+        self._drag_offset = None
         self.circular_geometry = QRect(100, 100, 200, 200)
         self.expanded_geometry = QRect(100, 100, 600, 400)
         
@@ -58,6 +115,7 @@ class CircularWindow(QWidget):
         self.geometry_animation = QPropertyAnimation(self, b"geometry")
         self.geometry_animation.setDuration(300)
         self.geometry_animation.setEasingCurve(QEasingCurve.InOutQuad)
+        self.geometry_animation.finished.connect(self._update_mask)
         
         # Setup logging
         logging.basicConfig(level=logging.INFO)
@@ -89,6 +147,10 @@ class CircularWindow(QWidget):
         self.tray_icon.setContextMenu(tray_menu)
         self.tray_icon.show()
         
+    def on_primary_screen_changed(self, screen):
+        """Keep the cached primary screen in sync"""
+        self._primary_screen = screen
+        
     def show_from_tray(self):
         """Show window from system tray"""
         self.show()
@@ -101,6 +163,10 @@ class CircularWindow(QWidget):
     def initUI(self):
         self.setGeometry(self.circular_geometry)
         
+        # Screen used for screenshots and the overlay, follows primary screen changes
+        self._primary_screen = QApplication.primaryScreen()
+        QApplication.instance().primaryScreenChanged.connect(self.on_primary_screen_changed)
+        
 
         # Add background animation for circular view
         try:
@@ -110,7 +176,10 @@ class CircularWindow(QWidget):
             self.movie = QMovie()
             self.movie.setFileName('')  # Empty movie acts as black background
 
-        self.movie.frameChanged.connect(self.repaint)
+        # Let the movie decode frames at window size instead of scaling each frame on paint
+        self.movie.setScaledSize(self.circular_geometry.size())
+        self._update_pending = False
+        self.movie.frameChanged.connect(self._on_movie_frame)
         self.movie.start()
         
         # Load static background for expanded view
@@ -119,89 +188,107 @@ class CircularWindow(QWidget):
         except Exception:
             self.night_bg = QPixmap()
         
+        # Scaled backgrounds are cached until the window size changes
+        self._scaled_night_bg = None
+        self._scaled_night_size = None
+        
+        # Offscreen buffer holding the composed background, reallocated on resize
+        self._buffer = None
+        self._buffer_key = None
+        
+        # State and size of the current window mask, rebuilt only when they change
+        self._clip_key = None
+        
         # Add search input
         self.search_input = QLineEdit(self)
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background-color: transparent;
-                border: 2px solid white;
-                border-radius: 15px;
-                padding: 5px 15px;
-                color: white;
-                selection-background-color: rgba(255, 255, 255, 50);
-            }
-        """)
         self.update_search_input_geometry()
         
         # Add search button
         self.search_btn = QPushButton("🔍", self)
-        self.search_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 2px solid white;
-                border-radius: 15px;
-                padding: 5px;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 50);
-            }
-        """)
         self.update_search_button_geometry()
         self.search_btn.clicked.connect(self.analyze_screenshot)
         
+        self._update_mask()
+        
         # Create context menu
+        self.setup_context_menu()
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
         
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Create path based on window state
-        path = QPainterPath()
-        if self.is_expanded:
-            path.addRoundedRect(0, 0, self.width(), self.height(), 20, 20)
-        else:
-            path.addEllipse(0, 0, self.width(), self.height())
-        
-        # Set up alpha mask composition
-        painter.setCompositionMode(QPainter.CompositionMode_Source)
-        
-        # Clear everything to transparent first
-        painter.fillRect(self.rect(), Qt.transparent)
-        
-        painter.setClipPath(path)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+    def _on_movie_frame(self):
+        """Schedule a repaint for a new movie frame, merging frames until the next paint"""
+        # The expanded background is static, the cloud frames are not visible there
+        if self.is_expanded or self._update_pending:
+            return
+        self._update_pending = True
+        self.update()
         
+    def paintEvent(self, event):
+        self._update_pending = False
+        # The window shape is applied by the mask, only the background needs painting.
+        # It is composed into a raster buffer which is reused until the content changes.
+        content_key = (self.is_expanded, None if self.is_expanded else self.movie.currentFrameNumber())
+        if self._buffer is None or self._buffer_key != content_key:
+            self._render_buffer()
+            self._buffer_key = content_key
+        QPainter(self).drawImage(0, 0, self._buffer)
+        
+    def _render_buffer(self):
+        """Compose the background into the raster buffer"""
+        if self._buffer is None:
+            ratio = self.devicePixelRatioF()
+            self._buffer = QImage(self.size() * ratio, QImage.Format_ARGB32_Premultiplied)
+            self._buffer.setDevicePixelRatio(ratio)
+        self._buffer.fill(Qt.transparent)
+        
+        painter = QPainter(self._buffer)
+        painter.setOpacity(180 / 255)
         if self.is_expanded:
             # Draw static night background when expanded
-            painter.drawPixmap(0, 0, self.night_bg.scaled(
-                self.width(), self.height(),
-                Qt.KeepAspectRatioByExpanding,
-                Qt.SmoothTransformation
-            ))
-        else:
-            # Draw animated cloud background when circular
-            if self.movie and self.movie.currentPixmap():
-                painter.drawPixmap(0, 0, self.movie.currentPixmap().scaled(
+            if self._scaled_night_bg is None or self._scaled_night_size != self.size():
+                self._scaled_night_bg = self.night_bg.scaled(
                     self.width(), self.height(),
                     Qt.KeepAspectRatioByExpanding,
                     Qt.SmoothTransformation
-                ))
-            
-        # Use black as the alpha mask
-        painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
-        painter.fillPath(path, QColor(0, 0, 0, 180))  # Black controls opacity
+                )
+                self._scaled_night_size = self.size()
+            painter.drawPixmap(0, 0, self._scaled_night_bg)
+        else:
+            # Draw animated cloud background when circular
+            if self.movie and self.movie.currentPixmap():
+                painter.drawPixmap(0, 0, self.movie.currentPixmap())
+        painter.end()
+
+    def _update_mask(self):
+        """Clip the window to a circle or a rounded rectangle depending on its state"""
+        # The shape only depends on state and size, keep it while neither changes
+        clip_key = (self.is_expanded, self.size())
+        if self._clip_key == clip_key:
+            return
+        path = QPainterPath()
+        if self.is_expanded:
+            path.addRoundedRect(0, 0, self.width(), self.height(), 20, 20)
+        else:
+            path.addEllipse(0, 0, self.width(), self.height())
+        self._clip_key = clip_key
+        self.setMask(QRegion(path.toFillPolygon().toPolygon()))
+
+    def resizeEvent(self, event):
+        """Drop the scaled background and buffer, rescale the movie and mask to the new window size"""
+        self._scaled_night_bg = None
+        self._buffer = None
+        self.movie.setScaledSize(event.size())
+        self._update_mask()
+        super().resizeEvent(event)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            self.oldPos = event.globalPos()
+            self._drag_offset = event.globalPos() - self.pos()
         elif event.button() == Qt.RightButton:
             self.show_context_menu(event.pos())
 
-    def show_context_menu(self, pos):
-        """Show the context menu with screenshot and hint options"""
+    def setup_context_menu(self):
+        """Build the context menu once, only the expand entry changes between uses"""
         menu = QMenu(self)
         menu.setStyleSheet("""
             QMenu {
@@ -221,25 +308,23 @@ class CircularWindow(QWidget):
         """)
         
         # Screenshot action
-        screenshot_action = QAction(QIcon.fromTheme("camera-photo"), "Take Screenshot", self)
+        screenshot_action = QAction(QIcon.fromTheme("camera-photo"), "Take Screenshot", menu)
         screenshot_action.triggered.connect(self.take_screenshot)
         menu.addAction(screenshot_action)
         
         # Show last hint action
-        hint_action = QAction(QIcon.fromTheme("help-hint"), "Show Last Hint", self)
+        hint_action = QAction(QIcon.fromTheme("help-hint"), "Show Last Hint", menu)
         hint_action.triggered.connect(self.show_last_hint)
         menu.addAction(hint_action)
         
-        # Toggle expand action
-        expand_action = QAction(QIcon.fromTheme("view-fullscreen"), 
-                              "Expand Window" if not self.is_expanded else "Collapse Window", 
-                              self)
-        expand_action.triggered.connect(self.toggle_window_size)
-        menu.addAction(expand_action)
+        # Toggle expand action, its text is updated before showing the menu
+        self._expand_action = QAction(QIcon.fromTheme("view-fullscreen"), "Expand Window", menu)
+        self._expand_action.triggered.connect(self.toggle_window_size)
+        menu.addAction(self._expand_action)
         
         
         # Launch portal action
-        portal_action = QAction(QIcon.fromTheme("applications-education"), "Open Portal", self)
+        portal_action = QAction(QIcon.fromTheme("applications-education"), "Open Portal", menu)
         portal_action.triggered.connect(self.launch_portal)
         menu.addAction(portal_action)
         
@@ -247,7 +332,7 @@ class CircularWindow(QWidget):
         menu.addSeparator()
         
         # Close action
-        close_action = QAction(QIcon.fromTheme("window-close"), "Close", self)
+        close_action = QAction(QIcon.fromTheme("window-close"), "Close", menu)
         def close_sequence():
             menu.hide()  # Hide instead of close
             # Use singleShot timer to delay window close slightly
@@ -256,6 +341,13 @@ class CircularWindow(QWidget):
         close_action.triggered.connect(close_sequence)
         menu.addAction(close_action)
         
+        self._context_menu = menu
+
+    def show_context_menu(self, pos):
+        """Show the context menu with screenshot and hint options"""
+        menu = self._context_menu
+        self._expand_action.setText("Expand Window" if not self.is_expanded else "Collapse Window")
+        
         # Calculate menu position to be horizontally centered
         menu_pos = self.mapToGlobal(pos)
         menu_pos.setX(menu_pos.x() - menu.sizeHint().width() // 2)
@@ -356,27 +448,9 @@ class CircularWindow(QWidget):
             self.apply_screen_hints()
         
     def mouseMoveEvent(self, event):
-        # Only allow movement in free mode
-        if self.screen_hint and self.screen_hint.mode != "free":
-            return
-            
-        # Check if we've moved to a different screen
-        new_screen = QApplication.desktop().screenNumber(event.globalPos())
-        if new_screen != self.current_screen:
-            self.current_screen = new_screen
-            self.update_screen_geometry()
-            
-        delta = event.globalPos() - self.oldPos
-        new_pos = self.pos() + delta
-        
-        # Ensure window stays within screen bounds
-        new_x = max(self.screen_x, min(new_pos.x(), 
-                   self.screen_x + self.screen_width - self.width()))
-        new_y = max(self.screen_y, min(new_pos.y(), 
-                   self.screen_y + self.screen_height - self.height()))
-        
-        self.move(new_x, new_y)
-        self.oldPos = event.globalPos()
+        # Drag the window, keeping the grabbed point under the cursor
+        if event.buttons() & Qt.LeftButton and self._drag_offset is not None:
+            self.move(event.globalPos() - self._drag_offset)
         
     def toggle_window_size(self):
         """Toggle between circular and expanded rectangular window"""
@@ -399,28 +473,41 @@ class CircularWindow(QWidget):
         if self.is_expanded:
             self.search_input.setGeometry(20, 20, 500, 60)
             self.search_input.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+            background = self.EXPANDED_CONTROL_BACKGROUND
         else:
             self.search_input.setGeometry(20, 85, 120, 30)
             self.search_input.setAlignment(Qt.AlignLeft)
+            background = self.COLLAPSED_CONTROL_BACKGROUND
+        self.search_input.setStyleSheet(self.SEARCH_INPUT_STYLE % background)
         
     def update_search_button_geometry(self):
         """Update search button size and position based on window state"""
         if self.is_expanded:
             self.search_btn.setGeometry(530, 20, 50, 60)
+            background = self.EXPANDED_CONTROL_BACKGROUND
         else:
             self.search_btn.setGeometry(150, 85, 30, 30)
+            background = self.COLLAPSED_CONTROL_BACKGROUND
+        self.search_btn.setStyleSheet(self.SEARCH_BUTTON_STYLE % background)
         
     def take_screenshot(self):
         self.logger.info("Taking screenshot...")
-        screen = QApplication.primaryScreen()
-        screenshot = screen.grabWindow(0)
+        screenshot = self._primary_screen.grabWindow(0)
         screenshot.save("shot01.png")
         self.logger.info("Screenshot saved as shot01.png")
         
+    def encode_screenshot(self, screenshot: QPixmap) -> str:
+        """Encode a screenshot as base64 JPEG without touching the disk"""
+        buffer = QByteArray()
+        buffer_device = QBuffer(buffer)
+        buffer_device.open(QBuffer.WriteOnly)
+        screenshot.save(buffer_device, "JPEG", 80)
+        buffer_device.close()
+        return base64.b64encode(bytes(buffer)).decode()
+        
     def show_last_hint(self):
         """Show the last hint if available"""
-        if hasattr(self, 'highlight_overlay'):
-            self.highlight_overlay.show_last_hint()
+        self.highlight_overlay.show_last_hint()
             
     def launch_portal(self):
         """Launch the portal application"""
@@ -428,6 +515,17 @@ class CircularWindow(QWidget):
             self.porttal = PortalWindow()
         self.porttal.show()
     
+    def stop_session_worker(self):
+        """Wait for a pending session request before the application exits"""
+        self.session_worker.quit()
+        self.session_worker.wait()
+        
+    def on_session_created(self, session_id):
+        """Store the API session once the worker has created it"""
+        self.session_id = session_id
+        if session_id:
+            self.logger.info(f"Created API session {session_id}")
+    
     def cleanup_session(self):
         """Clean up API session on close"""
         if self.session_id:
@@ -450,20 +548,27 @@ class CircularWindow(QWidget):
         if not question:
             self.logger.warning("No search query provided")
             return
+        if not self.session_id:
+            # Retry if creating the session failed, e.g. because the API was not up yet
+            if not self.session_worker.isRunning():
+                self.session_worker.start()
+            self.logger.warning("No API session available yet, please try again")
+            return
             
         try:
             self.logger.info(f"Sending prompt to API: {question}")
             
-            # Take screenshot and encode as base64
-            screen = QApplication.primaryScreen()
-            screenshot = screen.grabWindow(0)
+            # Take screenshot of what the user is asking about
+            screenshot = self._primary_screen.grabWindow(0)
             
-            # Save to bytes buffer and convert to base64
-            buffer = QByteArray()
-            buffer_device = QBuffer(buffer)
-            buffer_device.open(QBuffer.WriteOnly)
-            screenshot.save(buffer_device, "PNG")
-            screenshot_b64 = base64.b64encode(buffer.data()).decode()
+            # Downscale large screens before encoding, the coordinates are mapped back below
+            scale = 1.0
+            if max(screenshot.width(), screenshot.height()) > self.MAX_SCREENSHOT_SIZE:
+                scaled = screenshot.scaled(self.MAX_SCREENSHOT_SIZE, self.MAX_SCREENSHOT_SIZE,
+                                           Qt.KeepAspectRatio, Qt.FastTransformation)
+                scale = screenshot.width() / scaled.width()
+                screenshot = scaled
+            screenshot_b64 = self.encode_screenshot(screenshot)
             
             # Send to API
             data = {
@@ -479,18 +584,14 @@ class CircularWindow(QWidget):
             
             self.logger.info(f"Vision analysis response: {result}")
             
-            # Create and show highlight overlay
-            if not hasattr(self, 'highlight_overlay'):
-                self.highlight_overlay = HighlightOverlay()
-            
             # Get screen geometry to position overlay
-            screen = QApplication.primaryScreen()
-            screen_geometry = screen.geometry()
+            screen_geometry = self._primary_screen.geometry()
             self.highlight_overlay.setGeometry(screen_geometry)
             
             # Show the highlight at the specified coordinates with instructions
+            x, y = result['look_at_coordinates']
             self.highlight_overlay.set_highlight(
-                result['look_at_coordinates'],
+                (int(x * scale), int(y * scale)),
                 result['instructions']
             )
             
@@ -501,6 +602,8 @@ def main():
     # Enable high DPI scaling
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    # Required to import QtWebEngine lazily once the tutor is opened
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     
     app = QApplication(sys.argv)
     app.setAttribute(Qt.AA_UseHighDpiPixmaps)
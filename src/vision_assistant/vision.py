@@ -1,8 +1,13 @@
 from PyQt5.QtCore import QPoint, QRect, QTimer, Qt, QPropertyAnimation, QEasingCurve
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtGui import QPainter, QColor
+from PyQt5.QtGui import QPainter, QColor, QPixmap, QStaticText, QTextOption, QTransform
 
 class HighlightOverlay(QWidget):
+    # Fixed width and padding of the instructions text block
+    TEXT_WIDTH = 300
+    TEXT_PADDING = 15
+    HIGHLIGHT_RADIUS = 30
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
@@ -13,6 +18,14 @@ class HighlightOverlay(QWidget):
         self.opacity = 1.0
         self.instructions = []
         self.last_instructions = []
+        self._text_runs = []
+        self._text_bg_rect = None
+        self._hint_pixmap = None
+        
+        # Font used for the instructions, slightly bold
+        self._hint_font = self.font()
+        self._hint_font.setPointSize(10)
+        self._hint_font.setWeight(75)
         
         # Setup fade out animation
         self.fade_animation = QPropertyAnimation(self, b"windowOpacity")
@@ -32,7 +45,12 @@ class HighlightOverlay(QWidget):
         self.highlight_point = QPoint(point[0], point[1])
         self.last_highlight_point = self.highlight_point
         self.instructions = instructions if instructions else []
+        # Ensure instructions is a list
+        if not isinstance(self.instructions, list):
+            self.instructions = [self.instructions]
         self.last_instructions = self.instructions
+        self.prepare_layout()
+        self.render_hint()
         self.setWindowOpacity(1.0)
         self.show()
         self.update()
@@ -50,62 +68,95 @@ class HighlightOverlay(QWidget):
         if self.last_highlight_point and self.last_instructions:
             self.highlight_point = self.last_highlight_point
             self.instructions = self.last_instructions
+            self.prepare_layout()
+            self.render_hint()
             self.setWindowOpacity(1.0)
             self.show()
             self.update()
             self.hide_timer.stop()
             self.hide_timer.start(10000)
         
+    def prepare_layout(self):
+        """Lay out the circle and instructions once per hint, drawing only reads the result"""
+        self._text_runs = []
+        self._text_bg_rect = None
+        if not self.highlight_point or not self.instructions:
+            return
+        padding = self.TEXT_PADDING
+        
+        # Shape each instruction once and measure the total height
+        static_texts = []
+        # Justified and wrapped, as the instructions were drawn before
+        text_option = QTextOption(Qt.AlignJustify)
+        text_option.setWrapMode(QTextOption.WordWrap)
+        total_height = padding
+        for instruction in self.instructions:
+            static_text = QStaticText(instruction)
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.setTextOption(text_option)
+            static_text.setTextWidth(self.TEXT_WIDTH - (padding * 2))
+            static_text.prepare(QTransform(), self._hint_font)
+            static_texts.append(static_text)
+            total_height += int(static_text.size().height()) + padding
+        
+        # Position the text block next to the circle
+        block_x = self.highlight_point.x() + self.HIGHLIGHT_RADIUS + 20
+        block_y = int(self.highlight_point.y() - (total_height / 2))
+        self._text_bg_rect = QRect(block_x, block_y, self.TEXT_WIDTH, total_height)
+        
+        y_pos = block_y + padding
+        for static_text in static_texts:
+            self._text_runs.append((QPoint(block_x + padding, y_pos), static_text))
+            y_pos += int(static_text.size().height()) + padding
+        
+    def render_hint(self):
+        """Rasterize the highlight and instructions once, the fade only changes window opacity"""
+        if not self.highlight_point:
+            self._hint_pixmap = None
+            return
+        ratio = self.devicePixelRatioF()
+        self._hint_pixmap = QPixmap(self.size() * ratio)
+        self._hint_pixmap.setDevicePixelRatio(ratio)
+        self._hint_pixmap.fill(Qt.transparent)
+        painter = QPainter(self._hint_pixmap)
+        self.draw_hint(painter)
+        painter.end()
+        
+    def resizeEvent(self, event):
+        """Render the hint again for the new overlay size"""
+        super().resizeEvent(event)
+        if self._hint_pixmap is not None:
+            self.render_hint()
+        
     def paintEvent(self, event):
+        # Nothing visible is left at the end of the fade
+        if self.windowOpacity() < 0.02:
+            return
+        if self._hint_pixmap is not None:
+            QPainter(self).drawPixmap(0, 0, self._hint_pixmap)
+            
+    def draw_hint(self, painter):
+        """Draw the highlight circle and the instructions block"""
         if self.highlight_point:
-            painter = QPainter(self)
             painter.setRenderHint(QPainter.Antialiasing)
             
             # Draw semi-transparent circle
             painter.setBrush(QColor(255, 255, 0, 80))
             painter.setPen(QColor(255, 255, 0, 150))
-            radius = 30
-            painter.drawEllipse(self.highlight_point, radius, radius)
+            painter.drawEllipse(self.highlight_point, self.HIGHLIGHT_RADIUS, self.HIGHLIGHT_RADIUS)
+            
+            # Only the circle benefits from antialiasing, the text block is axis aligned
+            painter.setRenderHint(QPainter.Antialiasing, False)
             
             # Draw instructions
-            if self.instructions:
-                # Ensure instructions is a list
-                if not isinstance(self.instructions, list):
-                    self.instructions = [self.instructions]
-                # Set up text formatting
-                font = painter.font()
-                font.setPointSize(10)
-                font.setWeight(75)  # Make text slightly bold
-                painter.setFont(font)
-                
-                # Fixed width for text block
-                text_width = 300
-                padding = 15
-                
-                # Calculate total height needed
-                total_height = padding
-                for instruction in self.instructions:
-                    text_rect = QRect(0, 0, text_width - (padding * 2), 1000)
-                    bound_rect = painter.boundingRect(text_rect, Qt.TextWordWrap | Qt.AlignLeft, instruction)
-                    total_height += bound_rect.height() + padding
-                
-                # Position the text block
-                block_x = self.highlight_point.x() + radius + 20
-                block_y = int(self.highlight_point.y() - (total_height / 2))
-                
+            if self._text_bg_rect is not None:
                 # Draw background with rounded corners
-                text_bg = QRect(int(block_x), block_y, int(text_width), int(total_height))
                 painter.setPen(Qt.NoPen)
                 painter.setBrush(QColor(0, 0, 0, 180))
-                painter.drawRoundedRect(text_bg, 10, 10)
+                painter.drawRoundedRect(self._text_bg_rect, 10, 10)
                 
                 # Draw text
+                painter.setFont(self._hint_font)
                 painter.setPen(QColor(255, 255, 255))
-                y_pos = block_y + padding
-                for instruction in self.instructions:
-                    text_rect = QRect(block_x + padding, y_pos, 
-                                    text_width - (padding * 2), 1000)
-                    bound_rect = painter.drawText(text_rect, 
-                                               Qt.TextWordWrap | Qt.AlignLeft | Qt.TextJustificationForced,
-                                               instruction)
-                    y_pos += bound_rect.height() + padding
+                for position, static_text in self._text_runs:
+                    painter.drawStaticText(position, static_text)